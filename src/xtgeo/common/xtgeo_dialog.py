@@ -20,6 +20,7 @@ Other than logging, there is also a template for user interaction, which shall
 be used in client scripts::
 
   xtg.echo('This is a message')
+  xtg.say('This is a message about %s', something)
   xtg.warn('This is a warning')
   xtg.error('This is an error, will continue')
   xtg.critical('This is a big error, will exit')
@@ -34,23 +35,24 @@ In addition there are other classes:
 
 from __future__ import annotations
 
+import functools
 import getpass
-import inspect
 import logging
 import os
 import platform
 import re
 import sys
+import time
 import timeit
 import warnings
-from datetime import datetime as dtime
 from typing import Any, Literal
 
 from .log import null_logger
 from .version import __version__
 
 DEBUG = 0
-MLS = 10000000.0
+_SEP99 = "=" * 99
+_BAR79 = "#" * 79
 
 
 HEADER = "\033[1;96m"
@@ -62,6 +64,22 @@ CRITICAL = "\033[1;91m"
 ENDC = "\033[0m"
 BOLD = "\033[1m"
 UNDERLINE = "\033[4m"
+ERASE_EOL = "\033[K"
+
+# (prefix, endfix) decoration and level tag used by XTGeoDialog._output
+_IDX_DECOR = {
+    0: ("++", ""),
+    1: ("**", ""),
+    3: (">>", ""),
+    6: (WARN + "##", ENDC),
+    8: (ERROR + "!#", ENDC),
+    9: (CRITICAL + "!!", ENDC),
+}
+_LEVEL_TAG = {-5: "M", -8: "E", -9: "W"}
+
+# environment settings are read once at import; see _refresh_env()
+_ENV_LOGGING_LEVEL = os.environ.get("XTG_LOGGING_LEVEL")
+_ENV_LOGGING_FORMAT = os.environ.get("XTG_LOGGING_FORMAT")
 
 
 def _printdebug(*args: Any) -> None:
@@ -71,6 +89,23 @@ def _printdebug(*args: Any) -> None:
         print("XTG DEBUG:", *args)
 
 
+@functools.lru_cache(maxsize=1)
+def _host_user_version() -> tuple[str, str, str]:
+    """Return host name, user name and Python version; fixed for the process"""
+
+    pyver = "Python {}.{}.{}".format(*sys.version_info[:3])
+    return platform.node(), getpass.getuser(), pyver
+
+
+def _refresh_env() -> None:
+    """Re-read the XTG_* environment variables, e.g. after changing them in tests"""
+
+    global _ENV_LOGGING_LEVEL, _ENV_LOGGING_FORMAT
+
+    _ENV_LOGGING_LEVEL = os.environ.get("XTG_LOGGING_LEVEL")
+    _ENV_LOGGING_FORMAT = os.environ.get("XTG_LOGGING_FORMAT")
+
+
 class XTGShowProgress:
     """Class for showing progress of a computation to the terminal.
 
@@ -98,19 +133,24 @@ class XTGShowProgress:
         self._leadtext = leadtext
         self._skip = skip
         self._next = 0
+        self._nextstep = 0  # first step where progress reaches self._next
 
     def flush(self, step: int) -> None:
         if not self._show:
             return
-        progress = int(float(step) / float(self._max) * 100.0)
-        if progress >= self._next:
-            print(f"{self._leadtext}{progress}% {self._info}")
+        if step >= self._nextstep:
+            progress = step * 100 // self._max
+            # rewrite the same terminal line for each update
+            sys.stdout.write(f"\r{self._leadtext}{progress}% {self._info}{ERASE_EOL}")
+            sys.stdout.flush()
             self._next += self._skip
+            self._nextstep = -(-self._next * self._max // 100)
 
     def finished(self) -> None:
         if not self._show:
             return
-        print(f"{self._leadtext}{100}% {self._info}")
+        sys.stdout.write(f"\r{self._leadtext}{100}% {self._info}{ERASE_EOL}\n")
+        sys.stdout.flush()
 
 
 class XTGDescription:
@@ -120,56 +160,36 @@ class XTGDescription:
         self._txt: list[str] = []
 
     def title(self, atitle: str) -> None:
-        fmt = "=" * 99
+        fmt = _SEP99
         self._txt.append(fmt)
         fmt = f"{atitle}"
         self._txt.append(fmt)
-        fmt = "=" * 99
+        fmt = _SEP99
         self._txt.append(fmt)
 
     def txt(self, *atxt: Any) -> None:
-        fmt = self._smartfmt(list(atxt))
+        fmt = self._smartfmt(atxt)
         self._txt.append(fmt)
 
     def flush(self) -> None:
-        fmt = "=" * 99
+        fmt = _SEP99
         self._txt.append(fmt)
 
         for line in self._txt:
             print(line)
 
     def astext(self) -> str:
-        thetext = ""
-        fmt = "=" * 99
+        fmt = _SEP99
         self._txt.append(fmt)
 
-        for line in self._txt:
-            thetext += line + "\n"
-
-        return thetext[:-1]  # skip last \n
+        return "\n".join(self._txt)
 
     @staticmethod
-    def _smartfmt(atxt: list[str]) -> str:
-        # f-string does not work with starred
-        alen = len(atxt)
-        atxt.insert(1, "=>")
-        if alen == 1:
-            fmt = "{:40s}".format(*atxt)
-        elif alen == 2:
-            fmt = "{:40s} {:>2s} {}".format(*atxt)
-        elif alen == 3:
-            fmt = "{:40s} {:>2s} {}  {}".format(*atxt)
-        elif alen == 4:
-            fmt = "{:40s} {:>2s} {}  {}  {}".format(*atxt)
-        elif alen == 5:
-            fmt = "{:40s} {:>2s} {}  {}  {}  {}".format(*atxt)
-        elif alen == 6:
-            fmt = "{:40s} {:>2s} {}  {}  {}  {}  {}".format(*atxt)
-        elif alen == 7:
-            fmt = "{:40s} {:>2s} {}  {}  {}  {}  {}  {}".format(*atxt)
-        else:
-            fmt = "{:40s} {:>2s} {}  {}  {}  {}  {}  {}  {}".format(*atxt)
-        return fmt
+    def _smartfmt(atxt: tuple[Any, ...]) -> str:
+        head, *rest = atxt
+        if not rest:
+            return f"{head:40s}"
+        return f"{head:40s} => " + "  ".join(str(item) for item in rest)
 
 
 class _TimeFilter(logging.Filter):
@@ -179,16 +199,10 @@ class _TimeFilter(logging.Filter):
     # \python-logging-module-time-since-last-log
 
     def filter(self, record: logging.LogRecord) -> bool:
-        try:
-            last: float = self.last  # type: ignore
-        except AttributeError:
-            last = record.relativeCreated
+        last: float = getattr(self, "last", record.relativeCreated)
 
-        dlt = dtime.fromtimestamp(
-            record.relativeCreated / 1000.0
-        ) - dtime.fromtimestamp(last / 1000.0)
-
-        record.relative = f"{dlt.seconds + dlt.microseconds / MLS:7.3f}"
+        # relativeCreated is in milliseconds
+        record.relative = f"{(record.relativeCreated - last) / 1000.0:7.3f}"
 
         self.last = record.relativeCreated
         return True
@@ -212,6 +226,28 @@ class _Formatter(logging.Formatter):
         return super().format(record)
 
 
+@functools.lru_cache(maxsize=None)
+def _build_formatter(level: int) -> logging.Formatter:
+    """Return the (shared) logging formatter for a given format level"""
+
+    if level <= 1:
+        return logging.Formatter(fmt="%(levelname)8s: (%(relative)ss) \t%(message)s")
+
+    if level == 2:
+        return _Formatter(
+            fmt="%(levelname)8s (%(relative)ss) %(pathname)44s "
+            "[%(funcName)40s()] %(lineno)4d >> \t%(message)s"
+        )
+
+    return logging.Formatter(
+        fmt="%(asctime)s Line: %(lineno)4d %(name)44s "
+        "(Delta=%(relative)ss) "
+        "[%(funcName)40s()]"
+        "%(levelname)8s:"
+        "\t%(message)s"
+    )
+
+
 class XTGeoDialog:
     """System for handling dialogs and messages in XTGeo.
 
@@ -226,15 +262,16 @@ class XTGeoDialog:
         self._lformat = None
         self._lformatlevel = 1
         self._logginglevel = "CRITICAL"
+        self._numericallevel = logging.CRITICAL
         self._logginglevel_fromenv = None
         self._loggingname = ""
         self._showrtwarnings = True
 
         # a string, for Python logging:
-        self._logginglevel_fromenv = os.environ.get("XTG_LOGGING_LEVEL", None)
+        self._logginglevel_fromenv = _ENV_LOGGING_LEVEL
 
         # a number, for format, 1 is simple, 2 is more info etc
-        loggingformat = os.environ.get("XTG_LOGGING_FORMAT")
+        loggingformat = _ENV_LOGGING_FORMAT
 
         _printdebug("Logging format is", loggingformat)
 
@@ -255,6 +292,7 @@ class XTGeoDialog:
         validlevels = ("INFO", "WARNING", "DEBUG", "CRITICAL")
         if level in validlevels:
             self._logginglevel = level
+            self._numericallevel = getattr(logging, level)
         else:
             raise ValueError(
                 f"Invalid level given, must be one of: {', '.join(validlevels)}"
@@ -263,15 +301,7 @@ class XTGeoDialog:
     @property
     def numericallogginglevel(self) -> int:
         """Return a numerical logging level (read only)"""
-        llo = logging.CRITICAL
-        if self._logginglevel == "INFO":
-            llo = logging.INFO
-        elif self._logginglevel == "WARNING":
-            llo = logging.WARNING
-        elif self._logginglevel == "DEBUG":
-            llo = logging.DEBUG
-
-        return llo
+        return self._numericallevel
 
     @property
     def loggingformatlevel(self) -> int:
@@ -283,28 +313,15 @@ class XTGeoDialog:
 
         _printdebug("Logging format is", self._lformatlevel)
 
-        if self._lformatlevel <= 1:
-            fmt = logging.Formatter(fmt="%(levelname)8s: (%(relative)ss) \t%(message)s")
-
-        elif self._lformatlevel == 2:
-            fmt = _Formatter(
-                fmt="%(levelname)8s (%(relative)ss) %(pathname)44s "
-                "[%(funcName)40s()] %(lineno)4d >> \t%(message)s"
-            )
-
-        else:
-            fmt = logging.Formatter(
-                fmt="%(asctime)s Line: %(lineno)4d %(name)44s "
-                "(Delta=%(relative)ss) "
-                "[%(funcName)40s()]"
-                "%(levelname)8s:"
-                "\t%(message)s"
-            )
+        fmt = _build_formatter(min(max(self._lformatlevel, 1), 3))
 
         log = self._rootlogger
         for h in log.handlers:
-            h.addFilter(_TimeFilter())
-            h.setFormatter(fmt)
+            # avoid stacking a new _TimeFilter on each access
+            if not any(isinstance(f, _TimeFilter) for f in h.filters):
+                h.addFilter(_TimeFilter())
+            if h.formatter is not fmt:
+                h.setFormatter(fmt)
 
         self._lformat = fmt._fmt  # private attribute in Formatter()
         return self._lformat
@@ -347,23 +364,22 @@ class XTGeoDialog:
             xtg.print_xtgeo_header('myapp', '0.2.1', info='Beta release!')
         """
 
-        cur_version = "Python " + str(sys.version_info[0]) + "."
-        cur_version += str(sys.version_info[1]) + "." + str(sys.version_info[2])
+        host, user, cur_version = _host_user_version()
 
-        app = appname + ", version " + str(appversion)
+        app = f"{appname}, version {appversion}"
         if info:
-            app = app + " (" + info + ")"
+            app = f"{app} ({info})"
         print("")
         print(HEADER)
-        print("#" * 79)
+        print(_BAR79)
         print(f"#{app.center(77)}#")
-        print("#" * 79)
-        nowtime = dtime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(_BAR79)
+        nowtime = time.strftime("%Y-%m-%d %H:%M:%S")
         ver = f"Using XTGeo version {__version__}"
-        cur_version += f" @ {nowtime} on {platform.node()} by {getpass.getuser()}"
+        cur_version += f" @ {nowtime} on {host} by {user}"
         print(f"#{ver.center(77)}#")
         print(f"#{cur_version.center(77)}#")
-        print("#" * 79)
+        print(_BAR79)
         print(ENDC)
         print("")
 
@@ -441,69 +457,65 @@ class XTGeoDialog:
         """Show warnings issued by xtg.warn, if flag is True."""
         self._showrtwarnings = flag
 
-    def insane(self, string: str) -> None:
+    def insane(self, string: str, *args: Any) -> None:
         level = 4
         idx = 0
 
-        caller = sys._getframe(1).f_code.co_name
-        frame = inspect.stack()[1][0]
-        self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-        self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
-    def trace(self, string: str) -> None:
+    def trace(self, string: str, *args: Any) -> None:
         level = 3
         idx = 0
 
-        caller = sys._getframe(1).f_code.co_name
-        frame = inspect.stack()[1][0]
-        self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-        self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
-    def debug(self, string: str) -> None:
+    def debug(self, string: str, *args: Any) -> None:
         level = 2
         idx = 0
 
-        caller = sys._getframe(1).f_code.co_name
-        frame = inspect.stack()[1][0]
-        self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-        self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
-    def speak(self, string: str) -> None:
+    def speak(self, string: str, *args: Any) -> None:
         level = 1
         idx = 1
 
-        caller = sys._getframe(1).f_code.co_name
-        frame = inspect.stack()[1][0]
-        self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-        self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
     info = speak
 
-    def say(self, string: str) -> None:
+    def say(self, string: str, *args: Any) -> None:
         level = -5
         idx = 3
 
-        caller = sys._getframe(1).f_code.co_name
-        frame = inspect.stack()[1][0]
-        self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-        self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
-    def warn(self, string: str) -> None:
+    def warn(self, string: str, *args: Any) -> None:
         """Show warnings at Runtime (pure user info/warns)."""
+        if not self._showrtwarnings:
+            return
+
         level = 0
         idx = 6
 
-        if self._showrtwarnings:
-            caller = sys._getframe(1).f_code.co_name
-            frame = inspect.stack()[1][0]
-            self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-            self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
     warning = warn
 
@@ -521,35 +533,29 @@ class XTGeoDialog:
         warnings.simplefilter("default", UserWarning)
         warnings.warn(string, UserWarning, stacklevel=2)
 
-    def error(self, string: str) -> None:
+    def error(self, string: str, *args: Any) -> None:
         level = -8
         idx = 8
 
-        caller = sys._getframe(1).f_code.co_name
-        frame = inspect.stack()[1][0]
-        self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-        self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
-    def critical(self, string: str) -> None:
+    def critical(self, string: str, *args: Any) -> None:
         level = -9
         idx = 9
 
-        caller = sys._getframe(1).f_code.co_name
-        frame = inspect.stack()[1][0]
-        self.get_callerinfo(caller, frame)
+        frame = sys._getframe(1)
+        self.get_callerinfo(frame.f_code.co_name, frame)
 
-        self._output(idx, level, string)
+        self._output(idx, level, string, *args)
 
     def get_callerinfo(self, caller: Any, frame: Any) -> tuple[Any, str]:
         the_class = self._get_class_from_frame(frame)
 
-        # just keep the last class element
-        x = str(the_class).split(".")
-        the_class = x[-1]
-
         self._caller = caller
-        self._callclass = the_class
+        self._callclass = the_class.__name__ if the_class is not None else "None"
 
         return (self._caller, self._callclass)
 
@@ -559,46 +565,27 @@ class XTGeoDialog:
 
     @staticmethod
     def _get_class_from_frame(fr: Any) -> Any:
-        args, _, _, value_dict = inspect.getargvalues(fr)
+        code = fr.f_code
+        nargs = code.co_argcount + code.co_kwonlyargcount
 
         # we check the first parameter for the frame function is
         # named 'self'
-        if args and args[0] == "self":
-            instance = value_dict.get("self", None)
+        if nargs and code.co_varnames[0] == "self":
+            instance = fr.f_locals.get("self", None)
             if instance:
                 # return its class
                 return getattr(instance, "__class__", None)
         # return None otherwise
         return None
 
-    def _output(self, idx: int, level: int, string: str) -> None:
-        prefix = ""
-        endfix = ""
-
-        if idx == 0:
-            prefix = "++"
-        elif idx == 1:
-            prefix = "**"
-        elif idx == 3:
-            prefix = ">>"
-        elif idx == 6:
-            prefix = WARN + "##"
-            endfix = ENDC
-        elif idx == 8:
-            prefix = ERROR + "!#"
-            endfix = ENDC
-        elif idx == 9:
-            prefix = CRITICAL + "!!"
-            endfix = ENDC
-
-        ulevel = str(level)
-        if level == -5:
-            ulevel = "M"
-        if level == -8:
-            ulevel = "E"
-        if level == -9:
-            ulevel = "W"
-        print(
+    def _output(self, idx: int, level: int, string: str, *args: Any) -> None:
+        if args:
+            string = string % args
+
+        prefix, endfix = _IDX_DECOR.get(idx, ("", ""))
+        ulevel = _LEVEL_TAG.get(level, level)
+
+        sys.stdout.write(
             f"{prefix} <{ulevel}> [{self._callclass:23s}-> "
-            f"{self._caller:>33s}] {string}{endfix}"
+            f"{self._caller:>33s}] {string}{endfix}\n"
         )
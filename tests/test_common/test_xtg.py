@@ -2,6 +2,7 @@ import os
 import time
 
 from xtgeo.common import XTGeoDialog
+from xtgeo.common.xtgeo_dialog import _refresh_env
 
 xtg = XTGeoDialog()
 
@@ -23,6 +24,7 @@ def test_more_logging_tests(caplog):
     """
 
     os.environ["XTG_LOGGING_LEVEL"] = "INFO"
+    _refresh_env()
 
     xtgmore = XTGeoDialog()  # another instance
     locallogger = xtgmore.basiclogger(__name__, logginglevel="WARNING")
@@ -32,6 +34,7 @@ def test_more_logging_tests(caplog):
     locallogger.critical("Display critical")
 
     os.environ["XTG_LOGGING_LEVEL"] = "CRITICAL"
+    _refresh_env()
 
 
 def test_timer(capsys):
@@ -63,3 +66,15 @@ def test_user_msg():
     xtg.warning("This is also a warning")
     xtg.error("This is an error")
     xtg.critical("This is a critical error")
+
+
+def test_user_msg_deferred_args(capsys):
+    """Message arguments are %-formatted when the message is shown."""
+
+    xtg.say("Value is %s and %d", "abc", 42)
+    assert "Value is abc and 42" in capsys.readouterr().out
+
+    xtg.show_runtimewarnings(False)
+    xtg.warn("Not shown %s", "at all")
+    assert capsys.readouterr().out == ""
+    xtg.show_runtimewarnings(True)